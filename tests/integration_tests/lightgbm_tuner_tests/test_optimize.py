@@ -1,5 +1,3 @@
-import contextlib
-
 import mock
 import numpy as np
 import pytest
@@ -16,13 +14,19 @@ from optuna import type_checking
 if type_checking.TYPE_CHECKING:
     from typing import Any  # NOQA
     from typing import Dict  # NOQA
-    from typing import Generator  # NOQA
     from typing import List  # NOQA
 
 
-@contextlib.contextmanager
-def turnoff_train():
-    # type: () -> Generator[None, None, None]
+# The tests never mutate these datasets, so they are shared across tests to
+# avoid repeated `lgb.Dataset` construction.
+_DUMMY_DATASET = lgb.Dataset(None)
+_DUMMY_TRAIN_DATASET = lgb.Dataset(None)
+_DUMMY_VAL_DATASET = lgb.Dataset(None)
+
+
+@pytest.fixture(scope='module')
+def turnoff_train(request):
+    # type: (Any) -> Any
 
     unexpected_value = 0.5
     dummy_num_iterations = 1234
@@ -42,8 +46,10 @@ def turnoff_train():
 
     dummy_booster = DummyBooster()
 
-    with mock.patch('lightgbm.train', return_value=dummy_booster):
-        yield
+    patcher = mock.patch('lightgbm.train', return_value=dummy_booster)
+    patcher.start()
+    request.addfinalizer(patcher.stop)
+    return dummy_booster
 
 
 class TestOptunaObjective(object):
@@ -58,48 +64,48 @@ class TestOptunaObjective(object):
 
         assert execinfo.type is NotImplementedError
 
-    def test_call(self):
-        # type: () -> None
+    def test_call(self, turnoff_train):
+        # type: (Any) -> None
 
         target_param_names = ['lambda_l1']
         lgbm_params = {}  # type: Dict[str, Any]
-        train_set = lgb.Dataset(None)
-        val_set = lgb.Dataset(None)
+        train_set = _DUMMY_TRAIN_DATASET
+        val_set = _DUMMY_VAL_DATASET
 
         lgbm_kwargs = {'valid_sets': val_set}
         best_score = -np.inf
 
-        with turnoff_train():
-            objective = OptunaObjective(
-                target_param_names,
-                lgbm_params,
-                train_set,
-                lgbm_kwargs,
-                best_score,
-            )
-            study = optuna.create_study(direction='minimize')
-            study.optimize(objective, n_trials=10)
+        objective = OptunaObjective(
+            target_param_names,
+            lgbm_params,
+            train_set,
+            lgbm_kwargs,
+            best_score,
+        )
+        study = optuna.create_study(direction='minimize',
+                                    sampler=optuna.samplers.RandomSampler(seed=0))
+        study.optimize(objective, n_trials=2)
 
-            assert study.best_value == 0.5
+        assert study.best_value == 0.5
 
 
 class TestTimeKeeper(object):
     def test__timer_elapsed_secs(self):
         # type: () -> None
 
-        with mock.patch('time.time', return_value=1):
+        with mock.patch('optuna.integration.lightgbm_tuner.optimize.time.time',
+                        side_effect=[1, 10]):
             tk = _TimeKeeper()
-            with mock.patch('time.time', return_value=10):
-                assert tk.elapsed_secs() == 9
+            assert tk.elapsed_secs() == 9
 
 
 def test__timer_context():
     # type: () -> None
 
-    with mock.patch('time.time', return_value=1):
+    with mock.patch('optuna.integration.lightgbm_tuner.optimize.time.time',
+                    side_effect=[1, 10]):
         with _timer() as t:
-            with mock.patch('time.time', return_value=10):
-                assert t.elapsed_secs() == 9
+            assert t.elapsed_secs() == 9
 
 
 class TestBaseTuner(object):
@@ -117,22 +123,23 @@ class TestBaseTuner(object):
                 }
 
         booster = DummyBooster()
-        dummy_dataset = lgb.Dataset(None)
 
-        tuner = BaseTuner(lgbm_kwargs=dict(valid_sets=dummy_dataset))
+        tuner = BaseTuner(lgbm_kwargs=dict(valid_sets=_DUMMY_DATASET))
         val_score = tuner._get_booster_best_score(booster)
         assert val_score == expected_value
 
-    def test_higher_is_better(self):
-        # type: () -> None
-
-        for metric in ['auc', 'accuracy']:
-            tuner = BaseTuner(lgbm_params={'metric': metric})
-            assert tuner.higher_is_better()
+    @pytest.mark.parametrize('metric,higher', [
+        ('auc', True),
+        ('accuracy', True),
+        ('rmsle', False),
+        ('rmse', False),
+        ('binary_logloss', False),
+    ])
+    def test_higher_is_better(self, metric, higher):
+        # type: (str, bool) -> None
 
-        for metric in ['rmsle', 'rmse', 'binary_logloss']:
-            tuner = BaseTuner(lgbm_params={'metric': metric})
-            assert not tuner.higher_is_better()
+        tuner = BaseTuner(lgbm_params={'metric': metric})
+        assert tuner.higher_is_better() is higher
 
     def test_get_booster_best_score__using_valid_names_as_str(self):
         # type: () -> None
@@ -148,11 +155,10 @@ class TestBaseTuner(object):
                 }
 
         booster = DummyBooster()
-        dummy_dataset = lgb.Dataset(None)
 
         tuner = BaseTuner(lgbm_kwargs={
             'valid_names': 'dev',
-            'valid_sets': dummy_dataset,
+            'valid_sets': _DUMMY_DATASET,
         })
         val_score = tuner._get_booster_best_score(booster)
         assert val_score == expected_value
@@ -173,30 +179,36 @@ class TestBaseTuner(object):
                 }
 
         booster = DummyBooster()
-        dummy_train_dataset = lgb.Dataset(None)
-        dummy_val_dataset = lgb.Dataset(None)
 
         tuner = BaseTuner(lgbm_kwargs={
             'valid_names': ['train', 'val'],
-            'valid_sets': [dummy_train_dataset, dummy_val_dataset],
+            'valid_sets': [_DUMMY_TRAIN_DATASET, _DUMMY_VAL_DATASET],
         })
         val_score = tuner._get_booster_best_score(booster)
         assert val_score == expected_value
 
-    def test_compare_validation_metrics(self):
-        # type: () -> None
-
-        for metric in ['auc', 'accuracy']:
-            tuner = BaseTuner(lgbm_params={'metric': metric})
-            assert tuner.compare_validation_metrics(0.5, 0.1)
-            assert not tuner.compare_validation_metrics(0.5, 0.5)
-            assert not tuner.compare_validation_metrics(0.1, 0.5)
-
-        for metric in ['rmsle', 'rmse', 'binary_logloss']:
-            tuner = BaseTuner(lgbm_params={'metric': metric})
-            assert not tuner.compare_validation_metrics(0.5, 0.1)
-            assert not tuner.compare_validation_metrics(0.5, 0.5)
-            assert tuner.compare_validation_metrics(0.1, 0.5)
+    @pytest.mark.parametrize('metric,val_score,best_score,expected', [
+        ('auc', 0.5, 0.1, True),
+        ('auc', 0.5, 0.5, False),
+        ('auc', 0.1, 0.5, False),
+        ('accuracy', 0.5, 0.1, True),
+        ('accuracy', 0.5, 0.5, False),
+        ('accuracy', 0.1, 0.5, False),
+        ('rmsle', 0.5, 0.1, False),
+        ('rmsle', 0.5, 0.5, False),
+        ('rmsle', 0.1, 0.5, True),
+        ('rmse', 0.5, 0.1, False),
+        ('rmse', 0.5, 0.5, False),
+        ('rmse', 0.1, 0.5, True),
+        ('binary_logloss', 0.5, 0.1, False),
+        ('binary_logloss', 0.5, 0.5, False),
+        ('binary_logloss', 0.1, 0.5, True),
+    ])
+    def test_compare_validation_metrics(self, metric, val_score, best_score, expected):
+        # type: (str, float, float, bool) -> None
+
+        tuner = BaseTuner(lgbm_params={'metric': metric})
+        assert tuner.compare_validation_metrics(val_score, best_score) is expected
 
 
 class TestLightGBMTuner(object):
@@ -205,12 +217,10 @@ class TestLightGBMTuner(object):
         # type: (Dict[str, Any], lgb.Dataset, Dict[str, Any]) -> lgb.LightGBMTuner
 
         # Required keyword arguments.
-        dummy_dataset = lgb.Dataset(None)
-
         kwargs = dict(
             num_boost_round=5,
             early_stopping_rounds=2,
-            valid_sets=dummy_dataset,
+            valid_sets=_DUMMY_DATASET,
         )
         kwargs.update(kwargs_options)
 
@@ -221,10 +231,9 @@ class TestLightGBMTuner(object):
         # type: () -> None
 
         params = {}  # type: Dict[str, Any]
-        train_set = lgb.Dataset(None)
         with pytest.raises(ValueError) as excinfo:
             lgb.LightGBMTuner(params,
-                              train_set,
+                              _DUMMY_DATASET,
                               num_boost_round=5,
                               early_stopping_rounds=2)
 
@@ -243,8 +252,8 @@ class TestLightGBMTuner(object):
         # type: () -> None
 
         params = {}  # type: Dict[str, Any]
-        train_set = lgb.Dataset(None)
-        val_set = lgb.Dataset(None)
+        train_set = _DUMMY_TRAIN_DATASET
+        val_set = _DUMMY_VAL_DATASET
         kwargs = dict(
             num_boost_round=12,
             early_stopping_rounds=10,
@@ -276,125 +285,119 @@ class TestLightGBMTuner(object):
             runner.train_subset.construct()  # Cannot get label before construct `lgb.Dataset`.
             assert runner.train_subset.get_label().shape[0] == sample_size
 
-    def test_tune_feature_fraction(self):
-        # type: () -> None
+    def test_tune_feature_fraction(self, turnoff_train):
+        # type: (Any) -> None
 
         unexpected_value = 1.1  # out of scope.
 
-        with turnoff_train():
-            tuning_history = []  # type: List[Dict[str, float]]
-            best_params = {}  # type: Dict[str, Any]
-
-            runner = self._get_tuner_object(params=dict(
-                feature_fraction=unexpected_value,  # set default as unexpected value.
-            ), kwargs_options=dict(
-                tuning_history=tuning_history,
-                best_params=best_params,
-            ))
-            assert len(tuning_history) == 0
-            assert len(best_params) == 0
-            runner.tune_feature_fraction()
-
-            assert runner.lgbm_params['feature_fraction'] != unexpected_value
-            assert len(tuning_history) == 7
-            assert len(best_params) == 1
-
-    def test_tune_num_leaves(self):
-        # type: () -> None
+        tuning_history = []  # type: List[Dict[str, float]]
+        best_params = {}  # type: Dict[str, Any]
+
+        runner = self._get_tuner_object(params=dict(
+            feature_fraction=unexpected_value,  # set default as unexpected value.
+        ), kwargs_options=dict(
+            tuning_history=tuning_history,
+            best_params=best_params,
+        ))
+        assert len(tuning_history) == 0
+        assert len(best_params) == 0
+        runner.tune_feature_fraction()
+
+        assert runner.lgbm_params['feature_fraction'] != unexpected_value
+        assert len(tuning_history) == 7
+        assert len(best_params) == 1
+
+    def test_tune_num_leaves(self, turnoff_train):
+        # type: (Any) -> None
 
         unexpected_value = 1  # out of scope.
 
-        with turnoff_train():
-            tuning_history = []  # type: List[Dict[str, float]]
+        tuning_history = []  # type: List[Dict[str, float]]
 
-            runner = self._get_tuner_object(params=dict(
-                num_leaves=unexpected_value,
-            ), kwargs_options=dict(
-                tuning_history=tuning_history,
-                best_params={},
-            ))
-            assert len(tuning_history) == 0
-            runner.tune_num_leaves()
+        runner = self._get_tuner_object(params=dict(
+            num_leaves=unexpected_value,
+        ), kwargs_options=dict(
+            tuning_history=tuning_history,
+            best_params={},
+        ))
+        assert len(tuning_history) == 0
+        runner.tune_num_leaves()
 
-            assert runner.lgbm_params['num_leaves'] != unexpected_value
-            assert len(tuning_history) == 20
+        assert runner.lgbm_params['num_leaves'] != unexpected_value
+        assert len(tuning_history) == 20
 
-    def test_tune_bagging(self):
-        # type: () -> None
+    def test_tune_bagging(self, turnoff_train):
+        # type: (Any) -> None
 
         unexpected_value = 1  # out of scope.
 
-        with turnoff_train():
-            tuning_history = []  # type: List[Dict[str, float]]
+        tuning_history = []  # type: List[Dict[str, float]]
 
-            runner = self._get_tuner_object(params=dict(
-                bagging_fraction=unexpected_value,
-            ), kwargs_options=dict(
-                tuning_history=tuning_history,
-                best_params={},
-            ))
-            assert len(tuning_history) == 0
-            runner.tune_bagging()
+        runner = self._get_tuner_object(params=dict(
+            bagging_fraction=unexpected_value,
+        ), kwargs_options=dict(
+            tuning_history=tuning_history,
+            best_params={},
+        ))
+        assert len(tuning_history) == 0
+        runner.tune_bagging()
 
-            assert runner.lgbm_params['bagging_fraction'] != unexpected_value
-            assert len(tuning_history) == 10
+        assert runner.lgbm_params['bagging_fraction'] != unexpected_value
+        assert len(tuning_history) == 10
 
-    def test_tune_feature_fraction_stage2(self):
-        # type: () -> None
+    def test_tune_feature_fraction_stage2(self, turnoff_train):
+        # type: (Any) -> None
 
         unexpected_value = 0.5
 
-        with turnoff_train():
-            tuning_history = []  # type: List[Dict[str, float]]
+        tuning_history = []  # type: List[Dict[str, float]]
 
-            runner = self._get_tuner_object(params=dict(
-                feature_fraction=unexpected_value,
-            ), kwargs_options=dict(
-                tuning_history=tuning_history,
-                best_params={},
-            ))
-            assert len(tuning_history) == 0
-            runner.tune_feature_fraction_stage2()
+        runner = self._get_tuner_object(params=dict(
+            feature_fraction=unexpected_value,
+        ), kwargs_options=dict(
+            tuning_history=tuning_history,
+            best_params={},
+        ))
+        assert len(tuning_history) == 0
+        runner.tune_feature_fraction_stage2()
 
-            assert runner.lgbm_params['feature_fraction'] != unexpected_value
-            assert len(tuning_history) == 6
+        assert runner.lgbm_params['feature_fraction'] != unexpected_value
+        assert len(tuning_history) == 6
 
-    def test_tune_regularization_factors(self):
-        # type: () -> None
+    def test_tune_regularization_factors(self, turnoff_train):
+        # type: (Any) -> None
 
         unexpected_value = 20  # out of scope.
 
-        with turnoff_train():
-            tuning_history = []  # type: List[Dict[str, float]]
+        tuning_history = []  # type: List[Dict[str, float]]
 
-            runner = self._get_tuner_object(params=dict(
-                lambda_l1=unexpected_value,  # set default as unexpected value.
-            ), kwargs_options=dict(
-                tuning_history=tuning_history,
-                best_params={},
-            ))
-            assert len(tuning_history) == 0
-            runner.tune_regularization_factors()
+        runner = self._get_tuner_object(params=dict(
+            lambda_l1=unexpected_value,  # set default as unexpected value.
+        ), kwargs_options=dict(
+            tuning_history=tuning_history,
+            best_params={},
+        ))
+        assert len(tuning_history) == 0
+        runner.tune_regularization_factors()
 
-            assert runner.lgbm_params['lambda_l1'] != unexpected_value
-            assert len(tuning_history) == 20
+        assert runner.lgbm_params['lambda_l1'] != unexpected_value
+        assert len(tuning_history) == 20
 
-    def test_tune_min_data_in_leaf(self):
-        # type: () -> None
+    def test_tune_min_data_in_leaf(self, turnoff_train):
+        # type: (Any) -> None
 
         unexpected_value = 1  # out of scope.
 
-        with turnoff_train():
-            tuning_history = []  # type: List[Dict[str, float]]
+        tuning_history = []  # type: List[Dict[str, float]]
 
-            runner = self._get_tuner_object(params=dict(
-                min_child_samples=unexpected_value,  # set default as unexpected value.
-            ), kwargs_options=dict(
-                tuning_history=tuning_history,
-                best_params={},
-            ))
-            assert len(tuning_history) == 0
-            runner.tune_min_data_in_leaf()
+        runner = self._get_tuner_object(params=dict(
+            min_child_samples=unexpected_value,  # set default as unexpected value.
+        ), kwargs_options=dict(
+            tuning_history=tuning_history,
+            best_params={},
+        ))
+        assert len(tuning_history) == 0
+        runner.tune_min_data_in_leaf()
 
-            assert runner.lgbm_params['min_child_samples'] != unexpected_value
-            assert len(tuning_history) == 5
+        assert runner.lgbm_params['min_child_samples'] != unexpected_value
+        assert len(tuning_history) == 5